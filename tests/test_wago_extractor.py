@@ -5,7 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from wago_extractor.cli import main
+from wago_extractor.cli import _normalize_category_name, main
 from wago_extractor.core import WagoExtractor
 from wago_extractor.models import Expansion, ItemQuality, WoWItem
 
@@ -50,22 +50,43 @@ def test_wow_item_transformation():
     item_dict = item.to_dict()
     assert item_dict["Expansion"] == "CLASSIC"
     assert item_dict["Class"] == "CONSUMABLE"
+    assert tuple(item_dict) == WoWItem.CSV_COLUMNS
+    assert item.to_row() == tuple(item_dict.values())
 
 
-# --- CORE TESTS ---
+def test_wow_item_reads_only_declared_sparse_columns():
+    """Tests that from_rows never reads an ItemSparse column missing from SPARSE_COLUMNS."""
+    accessed_columns = set()
+
+    class RecordingRow(dict):
+        def __getitem__(self, key):
+            accessed_columns.add(key)
+            return super().__getitem__(key)
 
+        def get(self, key, default=None):
+            accessed_columns.add(key)
+            return super().get(key, default)
 
-def test_csv_row_counting(mock_directories):
-    """Tests the internal CSV line counter."""
-    raw_dir, _ = mock_directories
-    test_csv = raw_dir / "test.csv"
-    test_csv.write_text("id,name\n1,item1\n2,item2\n3,item3")
+    WoWItem.from_rows(RecordingRow(ID="1"), {"ClassID": "0", "SubclassID": "1"})
 
-    extractor = WagoExtractor(raw_dir=str(raw_dir))
-    assert extractor._count_csv_rows(test_csv) == 3
+    assert accessed_columns == WoWItem.SPARSE_COLUMNS
 
 
-@patch("requests.get")
+def test_wow_item_keeps_unknown_expansion_ids():
+    """Tests that expansions newer than the enum survive as raw IDs."""
+    item = WoWItem.from_rows(
+        {"ID": "1", "Display_lang": "Future Item", "ExpansionID": "99"},
+        {"ClassID": "2", "SubclassID": "7"},
+    )
+
+    assert item.expansion == 99
+    assert item.to_dict()["Expansion"] == "UNKNOWN_99"
+
+
+# --- CORE TESTS ---
+
+
+@patch("requests.Session.get")
 def test_downloader(mock_get, mock_directories):
     """Tests the downloader with a mocked network response."""
     raw_dir, processed_dir = mock_directories
@@ -81,9 +102,33 @@ def test_downloader(mock_get, mock_directories):
     file_path = extractor._download_table_with_progress("Item", progress_mock, "task1")
 
     assert file_path.exists()
+    assert file_path.read_bytes() == b"chunk1chunk2"
+    assert not (raw_dir / "Item.csv.part").exists()
     mock_get.assert_called_once()
 
 
+@patch("requests.Session.get")
+def test_downloader_revalidates_cached_table(mock_get, mock_directories):
+    """Tests that a cached table is reused when the server answers 304 Not Modified."""
+    raw_dir, processed_dir = mock_directories
+
+    fresh_response = MagicMock(status_code=200)
+    fresh_response.headers = {"content-length": "6", "ETag": '"v1"'}
+    fresh_response.iter_content.return_value = [b"ID\n1\n"]
+    not_modified_response = MagicMock(status_code=304)
+    mock_get.side_effect = [fresh_response, not_modified_response]
+
+    extractor = WagoExtractor(output_dir=str(processed_dir), raw_dir=str(raw_dir))
+    first_path = extractor._download_table_with_progress("Item", MagicMock(), "task1")
+    second_path = extractor._download_table_with_progress("Item", MagicMock(), "task1")
+
+    assert first_path == second_path
+    assert second_path.read_bytes() == b"ID\n1\n"
+    assert mock_get.call_args_list[0][1]["headers"] == {}
+    assert mock_get.call_args_list[1][1]["headers"] == {"If-None-Match": '"v1"'}
+    not_modified_response.iter_content.assert_not_called()
+
+
 def test_relational_join_logic(mock_directories):
     """Tests the complex indexing logic that joins ItemEffect to SpellCategory."""
     raw_dir, processed_dir = mock_directories
@@ -130,6 +175,68 @@ def test_relational_join_logic(mock_directories):
     assert "Super Pot" in file_content
 
 
+def test_csv_blank_lines_and_empty_files(mock_directories):
+    """Tests blank lines, ragged ItemSparse rows and an empty ItemSparse file."""
+    raw_dir, processed_dir = mock_directories
+
+    item_path = raw_dir / "Item.csv"
+    item_path.write_text("ID,ClassID,SubclassID\n500,0,1\n\n501,0,1\n")
+    sparse_path = raw_dir / "ItemSparse.csv"
+    sparse_path.write_text(
+        "ID,Display_lang,ExpansionID,Description_lang\n\n500,Super Pot,9,Heals\n\n501,Pot\n"
+    )
+    table_path_map = {"Item": item_path, "ItemSparse": sparse_path}
+    for table_name, header in (
+        ("ItemEffect", "ID,SpellCategoryID"),
+        ("SpellCategory", "ID,Name_lang"),
+        ("ItemXItemEffect", "ItemID,ItemEffectID"),
+    ):
+        table_path_map[table_name] = raw_dir / f"{table_name}.csv"
+        table_path_map[table_name].write_text(f"{header}\n\n")
+
+    extractor = WagoExtractor(output_dir=str(processed_dir), raw_dir=str(raw_dir))
+    items_by_category = extractor._process_data(table_path_map, ["potion"])
+    assert [item.id for item in items_by_category["potion"]] == [500, 501]
+    ragged_item = items_by_category["potion"][1]
+    assert (ragged_item.name, ragged_item.description, ragged_item.expansion) == ("Pot", "", 0)
+
+    sparse_path.write_text("")
+    assert extractor._process_data(table_path_map, ["potion"]) == {}
+
+
+def test_category_rules_bind_subclasses_to_their_item_class(mock_directories):
+    """Tests that subclass categories only match within their own item class."""
+    raw_dir, processed_dir = mock_directories
+    extractor = WagoExtractor(output_dir=str(processed_dir), raw_dir=str(raw_dir))
+    dispatch = extractor._compile_category_dispatch(
+        ["bandage", "sword_1h", "weapon", "plate", "food", "unknown"]
+    )
+
+    # Subclass 7 is BANDAGE for consumables but SWORD_1H for weapons
+    assert dispatch.categories_for(0, 7, "") == ("bandage",)
+    assert dispatch.categories_for(2, 7, "") == ("weapon", "sword_1h")
+    assert dispatch.categories_for(4, 4, "") == ("plate",)
+    assert dispatch.categories_for(2, 4, "") == ("weapon",)
+    assert dispatch.categories_for(0, 5, "Food (Well Fed)") == ("food",)
+    assert dispatch.categories_for(7, 0, "") == ()
+
+
+def test_lua_export_escapes_item_names(mock_directories):
+    """Tests that quotes, backslashes and newlines cannot break Lua string literals."""
+    raw_dir, processed_dir = mock_directories
+    extractor = WagoExtractor(output_dir=str(processed_dir), raw_dir=str(raw_dir))
+    item = WoWItem.from_rows(
+        {"ID": "5", "Display_lang": "Back\\Slash", "ExpansionID": "0"},
+        {"ClassID": "0", "SubclassID": "1"},
+    )
+    item.name += ' "Quoted"\n'
+
+    extractor._export_to_lua({"potion": [item]})
+
+    lua_content = (processed_dir / "data.lua").read_text()
+    assert '     [5] = "Back\\\\Slash \\"Quoted\\"\\n",\n' in lua_content
+
+
 # --- CLI TESTS ---
 
 
@@ -148,6 +255,27 @@ def test_cli_normalization_logic():
             assert "plate" in called_categories
 
 
+def test_cli_deduplicates_categories_in_order():
+    """Tests that normalized duplicates collapse while preserving input order."""
+    test_args = ["wago-extract", "-c", "potions", "weapon", "potion", "weapons"]
+
+    with patch.object(sys, "argv", test_args):
+        with patch("wago_extractor.cli.WagoExtractor") as mock_extractor:
+            main()
+
+            called_categories = mock_extractor.return_value.run.call_args[1]["target_categories"]
+
+            assert called_categories == ["potion", "weapon"]
+
+
+def test_cli_normalizes_aliased_subclasses():
+    """Tests that subclass aliases sharing an ID (e.g. PLATE/MACE_1H) are recognized."""
+    assert _normalize_category_name("plates") == "plate"
+    assert _normalize_category_name("Cloth ") == "cloth"
+    assert _normalize_category_name("drink") == "drinks"
+    assert _normalize_category_name("unknowns") == "unknowns"
+
+
 def test_cli_lua_flag():
     """Tests that the --lua flag is correctly passed to the extractor."""
     test_args = ["wago-extract", "-c", "food", "--lua"]
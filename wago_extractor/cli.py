@@ -12,6 +12,25 @@ from .models import ItemClass, ItemSubClass
 
 console = Console()
 
+# Hardcoded semantic overrides, keyed by every accepted spelling
+_SEMANTIC_OVERRIDES = {"drink": "drinks", "drinks": "drinks", "food": "food", "foods": "food"}
+
+# All valid singular identifiers from our data models. ``__members__`` is used so
+# that aliased subclasses sharing an ID (e.g. PLATE and MACE_1H) are included.
+_VALID_IDENTIFIERS = frozenset(
+    name.lower() for name in (*ItemClass.__members__, *ItemSubClass.__members__)
+)
+_PLURAL_IDENTIFIERS = {f"{identifier}s": identifier for identifier in _VALID_IDENTIFIERS}
+
+# Pre-rendered (type, identifier, value) rows for the --list table
+_CLASS_ROWS = tuple(
+    ("Class", name.lower(), str(member.value)) for name, member in ItemClass.__members__.items()
+)
+_SUBCLASS_ROWS = tuple(
+    ("Sub-Class", name.lower(), str(member.value))
+    for name, member in ItemSubClass.__members__.items()
+)
+
 
 def list_categories() -> None:
     """Prints a formatted table of all available item classes and subclasses."""
@@ -24,13 +43,13 @@ def list_categories() -> None:
     table.add_row("Semantic", "drinks", "-")
     table.add_section()
 
-    for item_class in ItemClass:
-        table.add_row("Class", item_class.name.lower(), str(item_class.value))
+    for row_values in _CLASS_ROWS:
+        table.add_row(*row_values)
 
     table.add_section()
 
-    for subclass in ItemSubClass:
-        table.add_row("Sub-Class", subclass.name.lower(), str(subclass.value))
+    for row_values in _SUBCLASS_ROWS:
+        table.add_row(*row_values)
 
     console.print(table)
     console.print(
@@ -52,27 +71,14 @@ def _normalize_category_name(category_input: str) -> str:
     """
     normalized_input = category_input.lower().strip().replace(" ", "_")
 
-    # Handle hardcoded semantic overrides
-    if normalized_input in ["drink", "drinks"]:
-        return "drinks"
-    if normalized_input in ["food", "foods"]:
-        return "food"
-
-    # Map all possible valid singular identifiers from our data models
-    # We combine Class and SubClass names for a single lookup set
-    valid_class_names = {item.name.lower() for item in ItemClass}
-    valid_subclass_names = {sub.name.lower() for sub in ItemSubClass}
-    all_valid_identifiers = valid_class_names | valid_subclass_names
+    semantic_override = _SEMANTIC_OVERRIDES.get(normalized_input)
+    if semantic_override is not None:
+        return semantic_override
 
-    if normalized_input in all_valid_identifiers:
+    if normalized_input in _VALID_IDENTIFIERS:
         return normalized_input
 
-    if normalized_input.endswith("s"):
-        singular_version = normalized_input[:-1]
-        if singular_version in all_valid_identifiers:
-            return singular_version
-
-    return normalized_input
+    return _PLURAL_IDENTIFIERS.get(normalized_input, normalized_input)
 
 
 def main() -> None:
@@ -146,14 +152,17 @@ def main() -> None:
         parser.print_help()
         sys.exit(1)
 
-    normalized_categories = {_normalize_category_name(category) for category in args.categories}
+    # dict.fromkeys de-duplicates while keeping the order the user typed
+    normalized_categories = list(
+        dict.fromkeys(_normalize_category_name(category) for category in args.categories)
+    )
 
     extractor = WagoExtractor(
         output_dir=args.output_dir, raw_dir=args.raw_dir, addon_namespace=args.namespace
     )
 
     extractor.run(
-        target_categories=list(normalized_categories), export_lua=args.lua, split_lua=args.split_lua
+        target_categories=normalized_categories, export_lua=args.lua, split_lua=args.split_lua
     )
 
 
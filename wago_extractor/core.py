@@ -1,14 +1,20 @@
 """Core logic: Downloader, Extractor, and Exporter with native Rich progress tracking."""
 
 import csv
+import json
 import logging
+import os
 import time
 from collections import defaultdict
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple, TextIO
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import (
@@ -29,6 +35,36 @@ from .models import Expansion, ItemClass, ItemSubClass, WoWItem
 
 console = Console()
 
+_ITEM_ID = attrgetter("id")
+_EXPANSION = attrgetter("expansion")
+_EXPANSION_AND_ID = attrgetter("expansion", "id")
+
+# Escapes the characters that would terminate or corrupt a double-quoted Lua string
+_LUA_STRING_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+class _CategoryDispatch(NamedTuple):
+    """Inverted index from item class IDs to the requested category keys."""
+
+    by_class: dict[int, tuple[str, ...]]
+    by_subclass: dict[tuple[int, int], tuple[str, ...]]
+    by_spell_keyword: tuple[tuple[str, str], ...]
+
+    def categories_for(
+        self, class_id: int, subclass_id: int, spell_category: str
+    ) -> tuple[str, ...]:
+        """Returns every requested category the given item qualifies for."""
+        matched_categories = self.by_class.get(class_id, ()) + self.by_subclass.get(
+            (class_id, subclass_id), ()
+        )
+        if self.by_spell_keyword and spell_category:
+            matched_categories += tuple(
+                category_key
+                for spell_keyword, category_key in self.by_spell_keyword
+                if spell_keyword in spell_category
+            )
+        return matched_categories
+
 
 class SmartProgressColumn(ProgressColumn):
     """Dynamic renderer for progress tracking supporting indeterminate states."""
@@ -54,9 +90,23 @@ class WagoExtractor:
     Attributes:
         BASE_URL: Root endpoint for Wago tools DB2 CSV exports.
         REQUIRED_TABLES: Tables required to fulfill the relational schema.
+        CONSUMABLE_SUBCLASSES: Subclass keys that resolve against the consumable class.
+        ARMOR_SUBCLASSES: Subclass keys that resolve against the armor class.
+        READ_BUFFER_SIZE: Buffer size of the handles CSV files are read through.
+        DOWNLOAD_CHUNK_SIZE: Byte size of each streamed HTTP response chunk.
+        DOWNLOAD_WORKERS: Upper bound on concurrent table downloads.
+        EXPORT_WORKERS: Upper bound on concurrent per-category CSV exports.
+        PROGRESS_BATCH_SIZE: Rows processed between progress bar updates.
+        WRITE_BUFFER_SIZE: Buffer size of the handles export files are written through.
     """
 
     BASE_URL = "https://wago.tools/db2"
+    READ_BUFFER_SIZE = 1 << 20
+    DOWNLOAD_CHUNK_SIZE = 1 << 20
+    DOWNLOAD_WORKERS = 8
+    EXPORT_WORKERS = 4
+    PROGRESS_BATCH_SIZE = 4096
+    WRITE_BUFFER_SIZE = 1 << 20
     REQUIRED_TABLES = [
         "Item",
         "ItemSparse",
@@ -64,6 +114,10 @@ class WagoExtractor:
         "ItemEffect",
         "SpellCategory",
     ]
+    CONSUMABLE_SUBCLASSES = frozenset(
+        {"POTION", "ELIXIR", "FLASK", "FOOD_AND_DRINK", "BANDAGE", "VANTUS_RUNES"}
+    )
+    ARMOR_SUBCLASSES = frozenset({"CLOTH", "LEATHER", "MAIL", "PLATE", "SHIELD"})
 
     def __init__(
         self,
@@ -83,6 +137,17 @@ class WagoExtractor:
         self.output_directory.mkdir(parents=True, exist_ok=True)
         self.raw_directory.mkdir(parents=True, exist_ok=True)
         self.addon_namespace = addon_namespace
+        self.http_session = requests.Session()
+        # Size the keep-alive pool so every concurrent download reuses a connection,
+        # and retry transient failures instead of aborting the whole run
+        self.http_session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.DOWNLOAD_WORKERS,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+            ),
+        )
         logging.basicConfig(level=logging.ERROR)
 
     def run(
@@ -109,8 +174,15 @@ class WagoExtractor:
         extracted_items_by_category = self._process_data(downloaded_table_paths, target_categories)
 
         console.print(f"\n[bold]3. Saving to [green]{self.output_directory}[/green][/bold]")
-        for category_name, item_list in extracted_items_by_category.items():
-            self._export_to_csv(item_list, category_name)
+        # Category files are independent, so they are written concurrently
+        with ThreadPoolExecutor(max_workers=self.EXPORT_WORKERS) as export_executor:
+            list(
+                export_executor.map(
+                    self._export_to_csv,
+                    extracted_items_by_category.values(),
+                    extracted_items_by_category.keys(),
+                )
+            )
 
         if export_lua:
             self._export_to_lua(extracted_items_by_category, split_lua=split_lua)
@@ -121,7 +193,10 @@ class WagoExtractor:
         )
 
     def _fetch_raw_data(self) -> dict[str, Path]:
-        """Orchestrates stream-buffered ingestion of required datasets.
+        """Orchestrates concurrent stream-buffered ingestion of required datasets.
+
+        All tables are fetched in parallel over a shared HTTP session so that
+        connection setup is amortized and network round-trips overlap.
 
         Returns:
             Mapping of table names to local filesystem paths.
@@ -129,20 +204,27 @@ class WagoExtractor:
         console.print(
             f"\n[bold]1. Downloading tables to [green]{self.raw_directory}[/green][/bold]"
         )
-        table_path_map = {}
-        with Progress(
-            TextColumn("  [blue]{task.description:25}"),
-            BarColumn(bar_width=40, style="grey37", complete_style="slate_blue1"),
-            TaskProgressColumn(),
-            DownloadColumn(),
-            TransferSpeedColumn(),
-            console=console,
-        ) as progress_context:
+        with (
+            Progress(
+                TextColumn("  [blue]{task.description:25}"),
+                BarColumn(bar_width=40, style="grey37", complete_style="slate_blue1"),
+                TaskProgressColumn(),
+                DownloadColumn(),
+                TransferSpeedColumn(),
+                console=console,
+            ) as progress_context,
+            ThreadPoolExecutor(max_workers=self.DOWNLOAD_WORKERS) as download_executor,
+        ):
+            pending_downloads = {}
             for table_name in self.REQUIRED_TABLES:
                 task_id = progress_context.add_task(f"Fetching {table_name}", total=None)
-                table_path_map[table_name] = self._download_table_with_progress(
-                    table_name, progress_context, task_id
+                pending_downloads[table_name] = download_executor.submit(
+                    self._download_table_with_progress, table_name, progress_context, task_id
                 )
+            table_path_map = {
+                table_name: download_future.result()
+                for table_name, download_future in pending_downloads.items()
+            }
         return table_path_map
 
     def _process_data(
@@ -158,7 +240,6 @@ class WagoExtractor:
             Denormalized item data grouped by category.
         """
         items_by_category: dict[str, list[WoWItem]] = defaultdict(list)
-        total_item_rows = self._count_csv_rows(table_paths["ItemSparse"])
 
         with Progress(
             SpinnerColumn(spinner_name="dots", style="blue"),
@@ -168,21 +249,39 @@ class WagoExtractor:
             console=console,
             transient=True,
         ) as progress_context:
+            category_dispatch = self._compile_category_dispatch(target_categories)
             indexing_task = progress_context.add_task("Indexing & Joining", total=4)
             item_metadata_map, item_to_spell_category_map = self._build_relational_indices(
                 table_paths, progress_context, indexing_task
             )
 
-            filtering_task = progress_context.add_task("Filtering Items", total=total_item_rows)
-            for row_data in self._read_csv_generator(table_paths["ItemSparse"]):
+            # ItemSparse is read exactly once; the task stays indeterminate and
+            # SmartProgressColumn reports the running row count instead.
+            filtering_task = progress_context.add_task("Filtering Items", total=None)
+            sparse_header = self._read_csv_header(table_paths["ItemSparse"])
+            # An empty file has no header and yields no rows, so the position is unused
+            sparse_id_position = sparse_header.index("ID") if sparse_header else 0
+            sparse_projection = [
+                (column_name, position)
+                for position, column_name in enumerate(sparse_header)
+                if column_name in WoWItem.SPARSE_COLUMNS
+            ]
+            unreported_rows = 0
+            for sparse_values in self._read_csv_rows(table_paths["ItemSparse"]):
                 self._evaluate_and_map_row(
-                    row_data,
+                    sparse_projection,
+                    sparse_values,
+                    sparse_id_position,
                     item_metadata_map,
                     item_to_spell_category_map,
-                    target_categories,
+                    category_dispatch,
                     items_by_category,
                 )
-                progress_context.update(filtering_task, advance=1)
+                unreported_rows += 1
+                if unreported_rows == self.PROGRESS_BATCH_SIZE:
+                    progress_context.update(filtering_task, advance=unreported_rows)
+                    unreported_rows = 0
+            progress_context.update(filtering_task, advance=unreported_rows)
 
         self._print_completion_bar("Indexing & Joining")
         self._print_completion_bar("Filtering Items")
@@ -191,19 +290,26 @@ class WagoExtractor:
 
     def _evaluate_and_map_row(
         self,
-        row_data: dict,
-        item_metadata: dict,
-        spell_category_map: dict,
-        targets: list[str],
+        projection: list[tuple[str, int]],
+        row_values: list[str],
+        id_position: int,
+        item_metadata: dict[int, tuple[int, int]],
+        spell_category_map: dict[int, str],
+        category_dispatch: _CategoryDispatch,
         results_accumulator: dict,
     ) -> None:
-        """Helper to evaluate a single row against target categories."""
-        item_id = int(row_data["ID"])
-        if item_id in item_metadata:
-            metadata_row = item_metadata[item_id]
+        """Helper to evaluate a single positional row against target categories."""
+        item_id = int(row_values[id_position])
+        class_ids = item_metadata.get(item_id)
+        if class_ids is not None:
             spell_category_name = spell_category_map.get(item_id, "")
             self._apply_category_filters(
-                row_data, metadata_row, spell_category_name, targets, results_accumulator
+                projection,
+                row_values,
+                class_ids,
+                spell_category_name,
+                category_dispatch,
+                results_accumulator,
             )
 
     def _print_completion_bar(self, label: str) -> None:
@@ -215,89 +321,135 @@ class WagoExtractor:
 
     def _build_relational_indices(
         self, table_paths: dict[str, Path], progress_tracker: Progress, task_id: Any
-    ) -> tuple[dict, dict]:
+    ) -> tuple[dict[int, tuple[int, int]], dict[int, str]]:
         """Constructs in-memory lookup indices for relational joins.
 
+        Item metadata is reduced to pre-parsed (ClassID, SubclassID) integers so
+        the per-row filter never re-parses them.
+
         Returns:
-            Tuple of (Item Metadata Map, Item ID to Spell Category Map).
+            Tuple of (Item ID to Class IDs Map, Item ID to Spell Category Map).
         """
         item_metadata = {
-            int(row["ID"]): row for row in self._read_csv_generator(table_paths["Item"])
+            int(item_id): (int(class_id), int(subclass_id))
+            for item_id, class_id, subclass_id in self._read_csv_columns(
+                table_paths["Item"], ("ID", "ClassID", "SubclassID")
+            )
         }
         progress_tracker.update(task_id, advance=1)
 
-        effect_to_spell_cat_id = {
-            int(row["ID"]): int(row["SpellCategoryID"])
-            for row in self._read_csv_generator(table_paths["ItemEffect"])
-            if row.get("SpellCategoryID")
+        spell_category_names = {
+            int(spell_category_id): category_name
+            for spell_category_id, category_name in self._read_csv_columns(
+                table_paths["SpellCategory"], ("ID", "Name_lang")
+            )
         }
         progress_tracker.update(task_id, advance=1)
 
-        spell_category_names = {
-            int(row["ID"]): row.get("Name_lang", "")
-            for row in self._read_csv_generator(table_paths["SpellCategory"])
+        # Resolve each effect straight to its category name so the bridge table
+        # below needs a single hash probe per row.
+        effect_to_category_name = {
+            int(effect_id): spell_category_names.get(int(spell_category_id), "")
+            for effect_id, spell_category_id in self._read_csv_columns(
+                table_paths["ItemEffect"], ("ID", "SpellCategoryID")
+            )
+            if spell_category_id and int(spell_category_id)
         }
         progress_tracker.update(task_id, advance=1)
 
         item_to_category_name = {}
-        for row in self._read_csv_generator(table_paths["ItemXItemEffect"]):
-            effect_id = int(row["ItemEffectID"])
-            spell_category_id = effect_to_spell_cat_id.get(effect_id)
-            if spell_category_id:
-                item_to_category_name[int(row["ItemID"])] = spell_category_names.get(
-                    spell_category_id, ""
-                )
+        for item_id, effect_id in self._read_csv_columns(
+            table_paths["ItemXItemEffect"], ("ItemID", "ItemEffectID")
+        ):
+            category_name = effect_to_category_name.get(int(effect_id))
+            if category_name is not None:
+                item_to_category_name[int(item_id)] = category_name
         progress_tracker.update(task_id, advance=1)
 
         return item_metadata, item_to_category_name
 
     def _apply_category_filters(
         self,
-        sparse_row: dict,
-        metadata_row: dict,
+        projection: list[tuple[str, int]],
+        row_values: list[str],
+        class_ids: tuple[int, int],
         spell_category: str,
-        target_categories: list[str],
+        category_dispatch: _CategoryDispatch,
         results: dict,
     ) -> None:
-        """Matches items against requested categories and appends to results."""
-        class_id = int(metadata_row["ClassID"])
-        subclass_id = int(metadata_row["SubclassID"])
+        """Matches items against requested categories and appends to results.
+
+        The WoWItem is materialized once, from only the (column name, position)
+        pairs in ``projection``, and shared by every category it qualifies for.
+        """
+        class_id, subclass_id = class_ids
+        matched_categories = category_dispatch.categories_for(class_id, subclass_id, spell_category)
+        if not matched_categories:
+            return
+
+        # Ragged rows omit trailing columns so from_rows falls back to its defaults
+        row_width = len(row_values)
+        sparse_row = {
+            name: row_values[position] for name, position in projection if position < row_width
+        }
+        metadata_row = {"ClassID": class_id, "SubclassID": subclass_id}
+        try:
+            wow_item = WoWItem.from_rows(sparse_row, metadata_row, spell_category)
+        except ValueError:
+            return
+        for category_key in matched_categories:
+            results[category_key].append(wow_item)
+
+    def _compile_category_dispatch(self, target_categories: list[str]) -> _CategoryDispatch:
+        """Inverts the requested categories' rules into per-row dict lookups."""
+        by_class: dict[int, list[str]] = defaultdict(list)
+        by_subclass: dict[tuple[int, int], list[str]] = defaultdict(list)
+        by_spell_keyword: list[tuple[str, str]] = []
 
         for category_key in target_categories:
-            if self._check_category_match(category_key, class_id, subclass_id, spell_category):
-                try:
-                    wow_item = WoWItem.from_rows(sparse_row, metadata_row, spell_category)
-                    results[category_key].append(wow_item)
-                except ValueError:
-                    continue
-
-    def _check_category_match(
-        self, category_key: str, class_id: int, subclass_id: int, spell_category: str
-    ) -> bool:
-        """Boolean check to see if IDs match the requested category logic."""
-        key_constant = category_key.upper().replace("-", "_")
+            category_rule = self._category_rule(category_key)
+            if category_rule is None:
+                continue
+            class_target, subclass_target, spell_keyword = category_rule
+            if spell_keyword is not None:
+                by_spell_keyword.append((spell_keyword, category_key))
+            elif class_target is not None and subclass_target is not None:
+                by_subclass[(class_target, subclass_target)].append(category_key)
+            elif class_target is not None:
+                by_class[class_target].append(category_key)
+
+        return _CategoryDispatch(
+            by_class={key: tuple(categories) for key, categories in by_class.items()},
+            by_subclass={key: tuple(categories) for key, categories in by_subclass.items()},
+            by_spell_keyword=tuple(by_spell_keyword),
+        )
+
+    @classmethod
+    def _category_rule(cls, category_key: str) -> tuple[int | None, int | None, str | None] | None:
+        """Compiles a category key into a (class ID, subclass ID, spell keyword) rule.
 
-        if category_key == "food" and "Food" in spell_category:
-            return True
-        if category_key == "drinks" and "Drink" in spell_category:
-            return True
+        ``None`` entries act as wildcards. Subclass keys are bound to the item
+        class they are defined under, and unknown keys compile to ``None``.
+        """
+        if category_key == "food":
+            return None, None, "Food"
+        if category_key == "drinks":
+            return None, None, "Drink"
 
+        key_constant = category_key.upper().replace("-", "_")
         if key_constant in ItemClass.__members__:
-            return class_id == ItemClass[key_constant].value
+            return ItemClass[key_constant].value, None, None
 
         if key_constant in ItemSubClass.__members__:
-            target_sub_id = ItemSubClass[key_constant].value
-            if subclass_id != target_sub_id:
-                return False
-
-            if key_constant in ["POTION", "ELIXIR", "FLASK", "FOOD_AND_DRINK"]:
-                return class_id == ItemClass.CONSUMABLE.value
-            if key_constant in ["CLOTH", "LEATHER", "MAIL", "PLATE", "SHIELD"]:
-                return class_id == ItemClass.ARMOR.value
-            if class_id == ItemClass.WEAPON.value:
-                return True
+            if key_constant in cls.CONSUMABLE_SUBCLASSES:
+                context_class = ItemClass.CONSUMABLE
+            elif key_constant in cls.ARMOR_SUBCLASSES:
+                context_class = ItemClass.ARMOR
+            else:
+                context_class = ItemClass.WEAPON
+            return context_class.value, ItemSubClass[key_constant].value, None
 
-        return False
+        return None
 
     def _display_summary(
         self, items_map: dict, exported_lua: bool, split_lua: bool, duration: float
@@ -321,89 +473,212 @@ class WagoExtractor:
         console.print(summary_table)
         console.print(f"\n[bold green]✨ Done![/bold green] [white]{duration:.2f}s[/white]\n")
 
-    def _count_csv_rows(self, file_path: Path) -> int:
-        """Counts rows in a CSV file efficiently."""
-        with open(file_path, "rb") as csv_file:
-            return sum(1 for _ in csv_file) - 1
+    def _read_csv_header(self, file_path: Path) -> list[str]:
+        """Returns the column names from the first non-blank line of a CSV file."""
+        with open(
+            file_path, encoding="utf-8", newline="", buffering=self.READ_BUFFER_SIZE
+        ) as csv_file:
+            return next(filter(None, csv.reader(csv_file)), [])
+
+    def _read_csv_rows(self, file_path: Path) -> Generator[list[str], None, None]:
+        """Reads CSV data rows as positional lists, skipping the header.
+
+        Blank lines parse as empty lists and are dropped, matching ``DictReader``.
+        """
+        with open(
+            file_path, encoding="utf-8", newline="", buffering=self.READ_BUFFER_SIZE
+        ) as csv_file:
+            csv_reader = filter(None, csv.reader(csv_file))
+            next(csv_reader, None)
+            yield from csv_reader
+
+    def _read_csv_columns(
+        self, file_path: Path, columns: tuple[str, ...]
+    ) -> Generator[tuple[str, ...], None, None]:
+        """Reads only the requested columns of each CSV row as positional tuples.
+
+        Columns missing from the header yield empty strings, mirroring the
+        ``row.get(column, "")`` access pattern of the dictionary reader. Blank
+        lines are skipped, as ``DictReader`` does.
 
-    def _read_csv_generator(self, file_path: Path) -> Generator[dict[str, Any], None, None]:
-        """Reads CSV rows as dictionaries via generator."""
-        with open(file_path, encoding="utf-8") as csv_file:
-            yield from csv.DictReader(csv_file)
+        Args:
+            file_path: Location of the CSV file.
+            columns: Header names to project, in the desired output order.
+
+        Yields:
+            One tuple per data row containing the projected values.
+        """
+        with open(
+            file_path, encoding="utf-8", newline="", buffering=self.READ_BUFFER_SIZE
+        ) as csv_file:
+            csv_reader = filter(None, csv.reader(csv_file))
+            header = next(csv_reader, [])
+            column_positions = {name: position for position, name in enumerate(header)}
+            projected_positions = [column_positions.get(name) for name in columns]
+            for row in csv_reader:
+                row_width = len(row)
+                yield tuple(
+                    row[position] if position is not None and position < row_width else ""
+                    for position in projected_positions
+                )
 
     def _download_table_with_progress(
         self, table_name: str, progress_bar: Progress, task_id: Any
     ) -> Path:
-        """Downloads a DB2 table with progress tracking."""
+        """Downloads a DB2 table with progress tracking.
+
+        Cached tables are revalidated with a conditional GET built from the
+        ``ETag``/``Last-Modified`` validators stored next to the CSV; a 304
+        response reuses the local copy without transferring the body.
+
+        The body is streamed into a sibling ``.part`` file which atomically
+        replaces the cached CSV only once the transfer has completed, so an
+        interrupted download never leaves a truncated table in the cache.
+        """
         target_path = self.raw_directory / f"{table_name}.csv"
+        partial_path = target_path.with_name(f"{target_path.name}.part")
+        metadata_path = target_path.with_name(f"{target_path.name}.meta.json")
         request_url = f"{self.BASE_URL}/{table_name}/csv"
-        http_response = requests.get(request_url, stream=True, timeout=60)
+        http_response = self.http_session.get(
+            request_url,
+            stream=True,
+            timeout=60,
+            headers=self._conditional_request_headers(target_path, metadata_path),
+        )
+
+        if http_response.status_code == requests.codes.not_modified:
+            http_response.close()
+            cached_bytes = target_path.stat().st_size
+            progress_bar.update(task_id, total=cached_bytes, completed=cached_bytes)
+            return target_path
+
         http_response.raise_for_status()
 
         total_bytes = int(http_response.headers.get("content-length", 0))
         progress_bar.update(task_id, total=total_bytes if total_bytes > 0 else None)
 
-        with open(target_path, "wb") as output_file:
-            for byte_chunk in http_response.iter_content(chunk_size=8192):
-                output_file.write(byte_chunk)
-                progress_bar.update(task_id, advance=len(byte_chunk))
+        try:
+            with open(partial_path, "wb") as output_file:
+                for byte_chunk in http_response.iter_content(chunk_size=self.DOWNLOAD_CHUNK_SIZE):
+                    output_file.write(byte_chunk)
+                    progress_bar.update(task_id, advance=len(byte_chunk))
+            os.replace(partial_path, target_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+
+        self._store_cache_validators(metadata_path, http_response.headers)
         return target_path
 
+    def _conditional_request_headers(
+        self, target_path: Path, metadata_path: Path
+    ) -> dict[str, str]:
+        """Builds revalidation headers from the validators of a cached table.
+
+        Returns:
+            ``If-None-Match``/``If-Modified-Since`` headers, or an empty mapping
+            when there is no usable cached copy.
+        """
+        if not (target_path.exists() and metadata_path.exists()):
+            return {}
+        try:
+            cache_validators = json.loads(metadata_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+        request_headers = {}
+        if cache_validators.get("etag"):
+            request_headers["If-None-Match"] = cache_validators["etag"]
+        if cache_validators.get("last_modified"):
+            request_headers["If-Modified-Since"] = cache_validators["last_modified"]
+        return request_headers
+
+    def _store_cache_validators(self, metadata_path: Path, response_headers: Any) -> None:
+        """Persists the response validators of a freshly downloaded table."""
+        cache_validators = {
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+        }
+        if any(cache_validators.values()):
+            metadata_path.write_text(json.dumps(cache_validators), encoding="utf-8")
+        else:
+            metadata_path.unlink(missing_ok=True)
+
     def _export_to_csv(self, item_list: list[WoWItem], category_name: str) -> None:
-        """Exports WoWItem objects to a CSV file."""
+        """Exports WoWItem objects to a CSV file.
+
+        The list is sorted in place and each item is streamed to the writer as a
+        positional ``to_row`` tuple, so no sorted copy or per-row dict is built.
+        """
         if not item_list:
             return
-        sorted_items = sorted(item_list, key=lambda item: item.id)
+        item_list.sort(key=_ITEM_ID)
         file_output_path = self.output_directory / f"{category_name}.csv"
-        with open(file_output_path, "w", newline="", encoding="utf-8") as csv_file:
-            csv_headers = list(sorted_items[0].to_dict().keys())
-            csv_writer = csv.DictWriter(csv_file, fieldnames=csv_headers)
-            csv_writer.writeheader()
-            csv_writer.writerows([item.to_dict() for item in sorted_items])
+        with open(
+            file_output_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=self.WRITE_BUFFER_SIZE,
+        ) as csv_file:
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(WoWItem.CSV_COLUMNS)
+            csv_writer.writerows(map(WoWItem.to_row, item_list))
 
     def _export_to_lua(
         self, category_data: dict[str, list[WoWItem]], split_lua: bool = False
     ) -> None:
         """Exports data as a Lua table for WoW Addons."""
-        merged_lua_buffer = [f"{self.addon_namespace} = {self.addon_namespace} or {{}}"]
-
-        for category_name, items in category_data.items():
-            category_lua_string = self._generate_category_lua_content(
-                category_name, items, include_header=split_lua
-            )
-
-            if split_lua:
-                (self.output_directory / f"{category_name}.lua").write_text(
-                    category_lua_string, encoding="utf-8"
-                )
-            else:
-                merged_lua_buffer.append(category_lua_string)
+        if split_lua:
+            for category_name, items in category_data.items():
+                with open(
+                    self.output_directory / f"{category_name}.lua",
+                    "w",
+                    encoding="utf-8",
+                    buffering=self.WRITE_BUFFER_SIZE,
+                ) as lua_file:
+                    self._write_category_lua(lua_file, category_name, items, include_header=True)
+            return
 
-        if not split_lua:
-            (self.output_directory / "data.lua").write_text(
-                "\n".join(merged_lua_buffer), encoding="utf-8"
-            )
+        with open(
+            self.output_directory / "data.lua",
+            "w",
+            encoding="utf-8",
+            buffering=self.WRITE_BUFFER_SIZE,
+        ) as lua_file:
+            lua_file.write(f"{self.addon_namespace} = {self.addon_namespace} or {{}}")
+            for category_name, items in category_data.items():
+                lua_file.write("\n")
+                self._write_category_lua(lua_file, category_name, items, include_header=False)
+
+    def _write_category_lua(
+        self, lua_file: TextIO, category_name: str, items: list[WoWItem], include_header: bool
+    ) -> None:
+        """Writes the Lua table representation for a single category.
 
-    def _generate_category_lua_content(
-        self, category_name: str, items: list[WoWItem], include_header: bool
-    ) -> str:
-        """Generates the Lua string representation for a single category."""
-        lua_lines = []
+        Args:
+            lua_file: Open text handle the category table is written to.
+            category_name: Category key, upper-cased to form the table name.
+            items: Items belonging to the category; sorted in place.
+            include_header: Whether to emit the namespace initializer first.
+        """
+        write = lua_file.write
         if include_header:
-            lua_lines.append(f"{self.addon_namespace} = {self.addon_namespace} or {{}}")
-
-        lua_lines.append(f"{self.addon_namespace}.{category_name.upper()} = {{")
-
-        items_by_expansion = defaultdict(list)
-        for item in items:
-            items_by_expansion[int(item.expansion)].append(item)
-
-        for expansion_id in sorted(items_by_expansion.keys()):
-            expansion_label = Expansion.get_name(expansion_id)
-            lua_lines.append(f"   [{expansion_id}] = {{ -- {expansion_label}")
-            for item in sorted(items_by_expansion[expansion_id], key=lambda i: i.id):
-                lua_lines.append(f'     [{item.id}] = "{item.name}",')
-            lua_lines.append("   },")
+            write(f"{self.addon_namespace} = {self.addon_namespace} or {{}}\n")
+
+        write(f"{self.addon_namespace}.{category_name.upper()} = {{\n")
+
+        # One in-place (expansion, id) sort yields every expansion group in ID order
+        items.sort(key=_EXPANSION_AND_ID)
+        format_expansion_line = "   [{}] = {{ -- {}\n".format
+        format_item_line = '     [{}] = "{}",\n'.format
+        for expansion, expansion_items in groupby(items, key=_EXPANSION):
+            expansion_id = int(expansion)
+            write(format_expansion_line(expansion_id, Expansion.get_name(expansion_id)))
+            lua_file.writelines(
+                format_item_line(item.id, item.name.translate(_LUA_STRING_ESCAPES))
+                for item in expansion_items
+            )
+            write("   },\n")
 
-        lua_lines.append("}\n")
-        return "\n".join(lua_lines)
+        write("}\n")
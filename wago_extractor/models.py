@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum, IntEnum
-from typing import Any
+from typing import Any, ClassVar
 
 
 class Expansion(IntEnum):
@@ -22,12 +22,13 @@ class Expansion(IntEnum):
     THE_WAR_WITHIN = 10
     MIDNIGHT = 11
 
-    @classmethod
-    def get_name(cls, value: int) -> str:
-        try:
-            return cls(value).name
-        except ValueError:
-            return f"UNKNOWN_{value}"
+    @staticmethod
+    def get_name(value: int) -> str:
+        return _EXPANSION_NAMES.get(value) or f"UNKNOWN_{value}"
+
+
+_EXPANSION_NAMES: dict[int, str] = {expansion.value: expansion.name for expansion in Expansion}
+_EXPANSIONS_BY_ID: dict[int, Expansion] = {expansion.value: expansion for expansion in Expansion}
 
 
 class ItemClass(Enum):
@@ -56,6 +57,12 @@ class ItemClass(Enum):
     HOUSING = 20
 
 
+_ITEM_CLASSES_BY_ID: dict[int, ItemClass] = {
+    item_class.value: item_class for item_class in ItemClass
+}
+_ITEM_CLASS_NAMES: dict[ItemClass, str] = {item_class: item_class.name for item_class in ItemClass}
+
+
 class ItemSubClass(IntEnum):
     """
     Commonly used SubClass IDs.
@@ -114,10 +121,49 @@ class ItemQuality(Enum):
     HEIRLOOM = 7
 
 
-@dataclass
+_ITEM_QUALITIES_BY_ID: dict[int, ItemQuality] = {quality.value: quality for quality in ItemQuality}
+_ITEM_QUALITY_NAMES: dict[ItemQuality, str] = {quality: quality.name for quality in ItemQuality}
+
+# Drops carriage returns and quotes and folds newlines into spaces in a single pass
+_CLEAN_TABLE = str.maketrans({"\r": None, "\n": " ", '"': None})
+
+
+def _clean_str(text: str) -> str:
+    if not text:
+        return ""
+    return text.translate(_CLEAN_TABLE).strip()
+
+
+@dataclass(slots=True)
 class WoWItem:
     """Represents a fully merged item (Metadata + Details)"""
 
+    SPARSE_COLUMNS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "ID",
+            "Display_lang",
+            "Description_lang",
+            "ExpansionID",
+            "OverallQualityID",
+            "ItemLevel",
+            "RequiredLevel",
+            "Stackable",
+            "SellPrice",
+        }
+    )
+    CSV_COLUMNS: ClassVar[tuple[str, ...]] = (
+        "ID",
+        "Name",
+        "Class",
+        "SubclassID",
+        "Quality",
+        "ItemLevel",
+        "ReqLevel",
+        "Expansion",
+        "SpellCategory",
+        "Description",
+    )
+
     id: int
     name: str
     class_id: ItemClass
@@ -135,49 +181,51 @@ class WoWItem:
     def from_rows(
         cls, sparse_row: dict[str, Any], item_row: dict[str, Any], spell_cat: str = ""
     ) -> "WoWItem":
-        def clean_str(text: str) -> str:
-            if not text:
-                return ""
-            return text.replace("\r", "").replace("\n", " ").replace('"', "").strip()
-
-        raw_exp_id = int(sparse_row.get("ExpansionID", 0))
-        expansion_val: Expansion | int
-        try:
-            expansion_val = Expansion(raw_exp_id)
-        except ValueError:
-            expansion_val = raw_exp_id
+        sparse_value = sparse_row.get
+
+        # Unknown expansions are kept as raw IDs so newer data still exports
+        raw_exp_id = int(sparse_value("ExpansionID", 0))
+        expansion_val: Expansion | int = _EXPANSIONS_BY_ID.get(raw_exp_id, raw_exp_id)
+
+        raw_class_id = int(item_row["ClassID"])
+        item_class = _ITEM_CLASSES_BY_ID.get(raw_class_id)
+        if item_class is None:
+            raise ValueError(f"{raw_class_id} is not a valid ItemClass")
+
+        raw_quality_id = int(sparse_value("OverallQualityID", 0))
+        item_quality = _ITEM_QUALITIES_BY_ID.get(raw_quality_id)
+        if item_quality is None:
+            raise ValueError(f"{raw_quality_id} is not a valid ItemQuality")
 
         return cls(
             id=int(sparse_row["ID"]),
-            name=clean_str(sparse_row.get("Display_lang", "")),
-            class_id=ItemClass(int(item_row["ClassID"])),
+            name=_clean_str(sparse_value("Display_lang", "")),
+            class_id=item_class,
             subclass_id=int(item_row["SubclassID"]),
-            quality=ItemQuality(int(sparse_row.get("OverallQualityID", 0))),
-            item_level=int(sparse_row.get("ItemLevel", 0)),
-            required_level=int(sparse_row.get("RequiredLevel", 0)),
-            stackable=int(sparse_row.get("Stackable", 1)),
-            sell_price=int(sparse_row.get("SellPrice", 0)),
+            quality=item_quality,
+            item_level=int(sparse_value("ItemLevel", 0)),
+            required_level=int(sparse_value("RequiredLevel", 0)),
+            stackable=int(sparse_value("Stackable", 1)),
+            sell_price=int(sparse_value("SellPrice", 0)),
             expansion=expansion_val,
-            description=clean_str(sparse_row.get("Description_lang", "")),
+            description=_clean_str(sparse_value("Description_lang", "")),
             spell_category_name=spell_cat,
         )
 
-    def to_dict(self) -> dict[str, Any]:
-        exp_label = (
-            self.expansion.name
-            if isinstance(self.expansion, Expansion)
-            else Expansion.get_name(self.expansion)
+    def to_row(self) -> tuple[Any, ...]:
+        """Returns the export values in ``CSV_COLUMNS`` order."""
+        return (
+            self.id,
+            self.name,
+            _ITEM_CLASS_NAMES[self.class_id],
+            self.subclass_id,
+            _ITEM_QUALITY_NAMES[self.quality],
+            self.item_level,
+            self.required_level,
+            Expansion.get_name(self.expansion),
+            self.spell_category_name,
+            self.description,
         )
 
-        return {
-            "ID": self.id,
-            "Name": self.name,
-            "Class": self.class_id.name,
-            "SubclassID": self.subclass_id,
-            "Quality": self.quality.name,
-            "ItemLevel": self.item_level,
-            "ReqLevel": self.required_level,
-            "Expansion": exp_label,
-            "SpellCategory": self.spell_category_name,
-            "Description": self.description,
-        }
+    def to_dict(self) -> dict[str, Any]:
+        return dict(zip(self.CSV_COLUMNS, self.to_row(), strict=True))